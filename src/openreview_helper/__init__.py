@@ -0,0 +1,4 @@
+from .cli import main
+from .models import Submission
+
+__all__ = ["Submission", "main"]
@@ -0,0 +1,718 @@
+import asyncio
+import datetime
+import json
+import logging
+import os
+import queue
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.firefox.service import Service
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import CONFIG_FILE, ConfigLoader, TextExtractor
+from .models import BrowserConfig, Submission
+
+if TYPE_CHECKING:
+    import aiohttp
+
+TIMEOUT_DURATION = 120  # The OR website is weird sometimes
+WAIT_TIMEOUT = 30  # Explicit waits for elements to show up on a page.
+PAGE_LOAD_TIMEOUT = 20  # Stop waiting on slow subresources after this long.
+POLL_FREQUENCY = 0.25
+COOKIE_FILE = "./.or_cookies.json"
+BASE_URL = "https://openreview.net"
+API_BASEURL = "https://api2.openreview.net"
+FORUM_URL = f"{BASE_URL}/forum?id={{}}"
+
+_NUMBER_RE = re.compile(r"Number:\s*(\S+)")
+# Characters that are not allowed in file names on some platforms.
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+PAPER_LINKS_SELECTOR = "#group-container div.note > h4 > a"
+TITLE_SELECTOR = ".citation_title"
+NOTE_CONTENT_SELECTOR = "div.forum-note > div.note-content"
+REPLIES_SELECTOR = "#forum-replies .depth-odd"
+# Resolves with the texts of the elements matching each selector as soon as
+# every selector matches, all in one round-trip. A MutationObserver wakes up on
+# the DOM change itself instead of polling; null means they did not all show
+# up in time.
+WAIT_FOR_TEXTS_JS = """(selectors, timeoutMs) => new Promise((resolve) => {
+  const ready = () => selectors.every((s) => document.querySelector(s));
+  const read = () => selectors.map((s) =>
+    Array.from(document.querySelectorAll(s)).map((e) => e.innerText));
+  if (ready()) return resolve(read());
+  const observer = new MutationObserver(() => {
+    if (ready()) {
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(read());
+    }
+  });
+  const timer = setTimeout(() => {
+    observer.disconnect();
+    resolve(null);
+  }, timeoutMs);
+  observer.observe(document.documentElement, { childList: true, subtree: true });
+})"""
+
+
+# What a driver was started with: browser config, browser, headless, grid URL,
+# Marionette port and the account it is logged in as.
+_DriverKey = tuple[
+    BrowserConfig, str, bool, Optional[str], Optional[int], Optional[str]
+]
+
+
+class ORAPI:
+    # Idle drivers left behind by closed keep_alive instances, reused by the
+    # next instance with the same driver settings in this process.
+    _driver_cache: dict[_DriverKey, list[webdriver.Remote]] = {}
+    _driver_cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        conf: str,
+        headless: bool = True,
+        config_file: str = CONFIG_FILE,
+        save_pages: bool = False,
+        workers: int = 4,
+        grid_url: Optional[str] = None,
+        cookie_file: Optional[str] = COOKIE_FILE,
+        marionette_port: Optional[int] = None,
+        browser: str = "firefox",
+        keep_alive: bool = False,
+    ):
+        """Initializes the OpenReviewAPI.
+
+        Args:
+        conf (str): Name of the conference.
+        headless (bool): Run without opening a browser window if True.
+        config_file (str): Path to configuration file.
+        workers (int): Number of browsers loading submissions in parallel.
+        grid_url (str): Selenium Grid hub to run the browsers on, local if None.
+        cookie_file (str): Where to cache the login session, disabled if None.
+        marionette_port (int): Attach to a Firefox already running with
+            --marionette on this port instead of starting a new one.
+        browser (str): "firefox" or "chromium".
+        keep_alive (bool): Keep the browsers running on close() for the next
+            instance in this process to reuse, see close_all().
+
+        Use as a context manager, or call close() when done.
+        """
+        # Load configuration
+        self.config_loader = ConfigLoader(config_file)
+        self.conf_config = self.config_loader.get_config(conf)
+        self.conf = conf
+        self.save_pages = save_pages
+        self.headless = headless
+        self.workers = workers
+        self.grid_url = grid_url
+        self.cookie_file = cookie_file
+        self.marionette_port = marionette_port
+        self.browser = browser
+        self.keep_alive = keep_alive
+
+        if marionette_port and workers > 1:
+            # A running Firefox only accepts a single WebDriver session.
+            logging.warning("Attaching to a running Firefox, using 1 worker.")
+            self.workers = 1
+
+        if save_pages:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.timestamp_dir = f"saved_pages/{timestamp}"
+
+        self.browser_config = self.config_loader.browser_config or BrowserConfig()
+
+        logging.info(f"Using configuration for conference: {self.conf}")
+
+        logging.debug(f"Browser configuration: {self.browser_config}")
+
+        # Pool of up to `workers` drivers. A thread checks one out for each
+        # page it loads; new drivers reuse the session cookies of the driver
+        # that logged in instead of going through the login form.
+        self._pool: queue.Queue[webdriver.Remote] = queue.Queue()
+        self._local = threading.local()
+        self._drivers: list[webdriver.Remote] = []
+        self._drivers_lock = threading.Lock()
+        self._account = self._login_name()
+        self._cookies = self._load_cookies()
+
+        # Start from the drivers a previous instance kept alive, if any.
+        with ORAPI._driver_cache_lock:
+            cached = ORAPI._driver_cache.get(self._driver_key, [])
+            reused = cached[: self.workers]
+            del cached[: self.workers]
+        for driver in reused:
+            self._drivers.append(driver)
+            self._pool.put(driver)
+
+        try:
+            with self._checkout():
+                self._login(self.conf_config.url)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ORAPI":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def _driver_key(self) -> _DriverKey:
+        return (
+            self.browser_config,
+            self.browser,
+            self.headless,
+            self.grid_url,
+            self.marionette_port,
+            self._account,
+        )
+
+    def close(self) -> None:
+        """Quit the browsers, or keep them for reuse if keep_alive is set."""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        if self.keep_alive:
+            with ORAPI._driver_cache_lock:
+                ORAPI._driver_cache.setdefault(self._driver_key, []).extend(drivers)
+            return
+        for driver in drivers:
+            driver.quit()
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Quit the browsers kept alive by closed keep_alive instances."""
+        with cls._driver_cache_lock:
+            cached = [d for drivers in cls._driver_cache.values() for d in drivers]
+            cls._driver_cache.clear()
+        for driver in cached:
+            driver.quit()
+
+    @property
+    def driver(self) -> webdriver.Remote:
+        """WebDriver checked out by the calling thread."""
+        driver: Optional[webdriver.Remote] = getattr(self._local, "driver", None)
+        if driver is None:
+            raise RuntimeError("No driver checked out on this thread.")
+        return driver
+
+    @contextmanager
+    def _checkout(self) -> Iterator[webdriver.Remote]:
+        """Borrow a driver from the pool, starting a new one if none is idle."""
+        try:
+            driver = self._pool.get_nowait()
+        except queue.Empty:
+            # At most `workers` threads load pages, so the pool stays that size.
+            driver = self._new_driver()
+        self._local.driver = driver
+        try:
+            yield driver
+        finally:
+            self._local.driver = None
+            self._pool.put(driver)
+
+    def _new_driver(self) -> webdriver.Remote:
+        """Create a driver that shares the session cookies, if there are any."""
+        driver = self._make_driver()
+        if self._cookies:
+            # Cookies can only be set on a page of their own domain.
+            self._open(driver, BASE_URL)
+            for cookie in self._cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    logging.debug(f"Skipping cookie {cookie.get('name')}")
+        return driver
+
+    def _make_driver(self) -> webdriver.Remote:
+        """Create a new WebDriver, locally or on the Selenium Grid."""
+        options: webdriver.FirefoxOptions | webdriver.ChromeOptions
+        if self.browser == "chromium":
+            options = self._chromium_options()
+        else:
+            options = self._firefox_options()
+        # Return from driver.get() on DOMContentLoaded, the explicit waits
+        # cover whatever renders afterwards.
+        options.page_load_strategy = "eager"
+
+        driver: webdriver.Remote
+        if self.grid_url:
+            logging.debug(f"Using Selenium Grid at: {self.grid_url}")
+            driver = webdriver.Remote(command_executor=self.grid_url, options=options)
+        elif isinstance(options, webdriver.ChromeOptions):
+            driver = webdriver.Chrome(options=options)
+        else:
+            driver = webdriver.Firefox(options=options, service=self._firefox_service())
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        # Leave room for WAIT_FOR_TEXTS_JS to give up on its own first.
+        driver.set_script_timeout(WAIT_TIMEOUT + 5)
+        with self._drivers_lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _firefox_service(self) -> Service:
+        """geckodriver service, attached to a running Firefox if requested."""
+        service_args = None
+        if self.marionette_port:
+            # Attach to the running browser instead of booting a new one.
+            service_args = [
+                "--connect-existing",
+                "--marionette-port",
+                str(self.marionette_port),
+            ]
+        return Service(self.browser_config.geckodriver_path, service_args=service_args)
+
+    def _firefox_options(self) -> webdriver.FirefoxOptions:
+        """Firefox options from the browser configuration."""
+        browser_config = self.browser_config
+        options = webdriver.FirefoxOptions()
+
+        if self.marionette_port:
+            # Launch options can not be applied to a running browser.
+            return options
+
+        if browser_config.firefox_binary:
+            logging.debug(f"Using Firefox binary at: {browser_config.firefox_binary}")
+            options.binary_location = browser_config.firefox_binary
+
+        if browser_config.window_size:
+            options.add_argument(f"--width={browser_config.window_size[0]}")
+            options.add_argument(f"--height={browser_config.window_size[1]}")
+
+        if browser_config.additional_args:
+            for arg in browser_config.additional_args:
+                options.add_argument(arg)
+
+        if self.headless:
+            options.add_argument("--headless")
+
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+
+        # We only read text: skip images, keep assets cached and use a single
+        # content process. Stylesheets stay on since innerText depends on them.
+        options.set_preference("permissions.default.image", 2)
+        options.set_preference("browser.cache.disk.enable", True)
+        options.set_preference("browser.cache.memory.enable", True)
+        options.set_preference("dom.ipc.processCount", 1)
+        return options
+
+    def _chromium_options(self) -> webdriver.ChromeOptions:
+        """Chromium options from the browser configuration."""
+        browser_config = self.browser_config
+        options = webdriver.ChromeOptions()
+
+        if browser_config.window_size:
+            width, height = browser_config.window_size
+            options.add_argument(f"--window-size={width},{height}")
+
+        if browser_config.additional_args:
+            for arg in browser_config.additional_args:
+                options.add_argument(arg)
+
+        if self.headless:
+            options.add_argument("--headless=new")
+
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        # We only read text, skip images.
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        return options
+
+    @staticmethod
+    def _open(driver: webdriver.Remote, url: str) -> None:
+        """Open url, keeping whatever has loaded if the page load times out."""
+        try:
+            driver.get(url)
+        except TimeoutException:
+            logging.warning(f"Timed out loading {url}, using the partial page.")
+            driver.execute_script("window.stop();")
+
+    @staticmethod
+    def _login_name() -> Optional[str]:
+        """LOGIN from the environment or .env, the account to scrape as."""
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        return os.environ.get("LOGIN")
+
+    def _load_cookies(self) -> list[dict[str, Any]]:
+        """Load the session cookies cached by a previous run of this account."""
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return []
+        try:
+            with open(self.cookie_file, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            logging.warning(f"Ignoring unreadable cookie file {self.cookie_file}")
+            return []
+        if not isinstance(cache, dict) or cache.get("login") != self._account:
+            logging.info("Cached login is for another account, logging in again.")
+            return []
+        cookies: list[dict[str, Any]] = cache.get("cookies", [])
+        return cookies
+
+    def _save_cookies(self) -> None:
+        """Cache the session cookies so the next run can skip the login form."""
+        self._cookies = self.driver.get_cookies()
+        if not self.cookie_file:
+            return
+        # The cookies grant access to the account, keep them private. The mode
+        # only applies when the file is created, so also fix up an older one.
+        fd = os.open(self.cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump({"login": self._account, "cookies": self._cookies}, f)
+        os.chmod(self.cookie_file, 0o600)
+
+    def _wait(self) -> WebDriverWait:
+        """Explicit wait on the driver checked out by the calling thread."""
+        return WebDriverWait(self.driver, WAIT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
+
+    def _save_page(self, filename: str) -> None:
+        """Generic function to save current page HTML."""
+        if not self.save_pages:
+            return
+
+        os.makedirs(self.timestamp_dir, exist_ok=True)
+        filepath = f"{self.timestamp_dir}/{filename}"
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(self.driver.page_source)
+
+    def _login(self, url: str) -> None:
+        # Navigate to url. With valid cached cookies this shows the dashboard
+        # right away, otherwise OpenReview asks us to log in first.
+        logging.info(f"Opening {url}")
+        self._open(self.driver, url)
+        logging.info("Waiting for login page to load...")
+        try:
+            self._wait().until(
+                ec.any_of(
+                    ec.presence_of_element_located((By.ID, "email-input")),
+                    ec.presence_of_element_located(
+                        (By.CSS_SELECTOR, PAPER_LINKS_SELECTOR)
+                    ),
+                )
+            )
+        except TimeoutException:
+            pass
+
+        if self.driver.find_elements(By.ID, "email-input"):
+            # Username and password, .env was loaded by _login_name().
+            username = os.environ["LOGIN"]
+            password = os.environ["PASSWORD"]
+
+            self.driver.find_element(By.ID, "email-input").send_keys(username)
+            self.driver.find_element(By.ID, "password-input").send_keys(password)
+            self.driver.find_element(By.CLASS_NAME, "btn-login").click()
+            logging.info("Logging in.")
+        else:
+            logging.info("Reusing cached login.")
+
+        # Wait for page to load, get urls to all papers.
+        logging.info("Waiting for page to finish loading...")
+
+        # The dashboard can take a while after a fresh login (the OR website is
+        # weird sometimes), so allow the full TIMEOUT_DURATION here.
+        wait = WebDriverWait(self.driver, TIMEOUT_DURATION, poll_frequency=0.5)
+        try:
+            elements = wait.until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, PAPER_LINKS_SELECTOR)
+            )
+        except TimeoutException:
+            logging.warning("No submissions showed up on the landing page.")
+            elements = []
+        urls = [
+            href
+            for href in (element.get_attribute("href") for element in elements)
+            if href is not None
+        ]
+        self.paper_urls = urls
+        if urls:
+            logging.info("Logged in.")
+            logging.info(f"Found {len(urls)} submissions.")
+            self._save_cookies()
+
+        self._save_page("landing_page.html")
+
+    def _wait_for_texts(self, *selectors: str) -> Optional[list[list[str]]]:
+        """Texts of the elements matching each selector once all show up, if ever."""
+        driver = self.driver
+        timeout_ms = WAIT_TIMEOUT * 1000
+        texts: Optional[list[list[str]]]
+        if isinstance(driver, ChromiumDriver):
+            # Evaluate through CDP directly, skipping WebDriver's script wrapper.
+            expression = f"({WAIT_FOR_TEXTS_JS})({json.dumps(selectors)}, {timeout_ms})"
+            result = driver.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {"expression": expression, "awaitPromise": True, "returnByValue": True},
+            )
+            texts = result["result"].get("value")
+        else:
+            texts = driver.execute_async_script(
+                f"({WAIT_FOR_TEXTS_JS})(arguments[0], arguments[1]).then(arguments[2]);",
+                list(selectors),
+                timeout_ms,
+            )
+        return texts
+
+    def _read_replies(self) -> list[str]:
+        """Text of all top-level replies, read in a single round-trip."""
+        try:
+            texts = self._wait_for_texts(REPLIES_SELECTOR)
+        except TimeoutException:
+            # The script timeout is the backstop for a page that hangs.
+            logging.warning("Timed out waiting for replies, skipping.")
+            texts = None
+        if texts is None:
+            logging.debug("No replies showed up, assuming there are none yet.")
+            return []
+        return texts[0]
+
+    def _parse_rating(self, texts: list[str]) -> tuple[list[int], list[int], list[int]]:
+        """Parse ratings from reply texts using configuration."""
+        return TextExtractor.extract_reviews(texts, self.conf_config)
+
+    def load_submission(self, url: str, skip_reviews: bool = False) -> Submission:
+        """Navigate to submission link and parse info.
+
+        Args:
+        url (str): URL to submission.
+        skip_reviews (bool): Skip looking for reviews and ratings?
+
+        Returns:
+        Instance of Submission().
+        """
+        with self._checkout():
+            return self._load_submission(url, skip_reviews)
+
+    def _load_submission(self, url: str, skip_reviews: bool) -> Submission:
+        """load_submission() on the driver checked out by the calling thread."""
+        # Open url.
+        self._open(self.driver, url)
+
+        # Get submission title and ID in one round-trip.
+        note = self._wait_for_texts(TITLE_SELECTOR, NOTE_CONTENT_SELECTOR)
+        if note is None:
+            raise TimeoutException(f"Submission did not load: {url}")
+        title, content = note[0][0], note[1][0]
+        number = _NUMBER_RE.search(content)
+        if number is None:
+            raise ValueError(f"No submission number found on {url}")
+        sub_id = number.group(1)
+
+        logging.debug(f"Loaded submission: {sub_id} - {title}")
+
+        safe_title = _SANITIZE_RE.sub("_", title)[:50]
+        self._save_page(f"{sub_id}_{safe_title}.html")
+
+        # Get replies.
+        ratings: list[int] = []
+        confidences: list[int] = []
+        final_ratings: list[int] = []
+        if not skip_reviews:
+            texts = self._read_replies()
+            ratings, confidences, final_ratings = self._parse_rating(texts)
+
+        return Submission(title, sub_id, ratings, confidences, final_ratings)
+
+    def load_all_submissions(
+        self, skip_reviews: bool = False, paper_urls: Optional[list[str]] = None
+    ) -> Iterator[Submission]:
+        """Yield submission info as it loads, in the order of paper_urls.
+
+        Up to `workers` submissions load at once, each on a driver borrowed
+        from the pool.
+
+        Args:
+        skip_reviews (bool): Skip looking for reviews and ratings?
+        paper_urls (list[str]): Submissions to load, all of them if None.
+        """
+        if paper_urls is None:
+            paper_urls = self.paper_urls
+        from tqdm import tqdm
+
+        load_one = partial(self.load_submission, skip_reviews=skip_reviews)
+        if self.workers <= 1:
+            # No need for a thread, the driver that logged in does it all.
+            for paper_url in tqdm(paper_urls):
+                yield load_one(paper_url)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as ex:
+            yield from tqdm(ex.map(load_one, paper_urls), total=len(paper_urls))
+
+
+def _pretty_field(name: str) -> str:
+    """Render a note content key the way the OpenReview website labels it."""
+    return " ".join(word[:1].upper() + word[1:] for word in name.split("_"))
+
+
+class ORClient:
+    """Fetches submissions through the OpenReview REST API instead of a browser.
+
+    Reviews are rendered as "Field Name: value" lines, so the text extraction
+    configured in the YAML file works unchanged.
+    """
+
+    def __init__(self, conf: str, config_file: str = CONFIG_FILE, workers: int = 50):
+        """Initializes the OpenReview REST client.
+
+        Args:
+        conf (str): Name of the conference.
+        config_file (str): Path to configuration file.
+        workers (int): Maximum number of requests in flight at once.
+        """
+        self.config_loader = ConfigLoader(config_file)
+        self.conf_config = self.config_loader.get_config(conf)
+        self.conf = conf
+        self.workers = workers
+
+        logging.info(f"Using configuration for conference: {self.conf}")
+
+        from openreview.api import OpenReviewClient
+
+        self.client = OpenReviewClient(baseurl=API_BASEURL)
+
+        self._login(self.conf_config.url)
+
+    def _login(self, url: str) -> None:
+        from dotenv import load_dotenv
+
+        # Load username and password.
+        load_dotenv()
+        username = os.environ["LOGIN"]
+        password = os.environ["PASSWORD"]
+
+        logging.info("Logging in.")
+        self.client.login_user(username=username, password=password)
+
+        # The dashboard URL points at the role group, e.g. .../Area_Chairs,
+        # whose assignment edges link our profile (tail) to papers (head).
+        group_id = parse_qs(urlparse(url).query)["id"][0]
+        edges = self.client.get_all_edges(
+            invitation=f"{group_id}/-/Assignment", tail=self.client.profile.id
+        )
+        self.paper_urls = [FORUM_URL.format(edge.head) for edge in edges]
+        logging.info(f"Found {len(self.paper_urls)} submissions.")
+
+    def _parse_rating(
+        self, note: dict[str, Any]
+    ) -> tuple[list[int], list[int], list[int]]:
+        """Parse ratings from the official reviews among the replies of a note."""
+        # Only reviews, so that ratings quoted in comments, meta-reviews or
+        # decisions do not end up in the numbers.
+        texts = [
+            "\n".join(
+                f"{_pretty_field(key)}: {entry.get('value')}"
+                for key, entry in reply["content"].items()
+            )
+            for reply in note["details"]["replies"]
+            if any(
+                invitation.endswith("/Official_Review")
+                for invitation in reply.get("invitations", [])
+            )
+        ]
+        return TextExtractor.extract_reviews(texts, self.conf_config)
+
+    def _parse_note(self, note: dict[str, Any], skip_reviews: bool) -> Submission:
+        """Build a Submission from a note fetched with its replies."""
+        title = note["content"]["title"]["value"]
+        sub_id = str(note["number"])
+
+        logging.debug(f"Loaded submission: {sub_id} - {title}")
+
+        ratings: list[int] = []
+        confidences: list[int] = []
+        final_ratings: list[int] = []
+        if not skip_reviews:
+            ratings, confidences, final_ratings = self._parse_rating(note)
+
+        return Submission(title, sub_id, ratings, confidences, final_ratings)
+
+    async def _open_session(
+        self,
+    ) -> "tuple[aiohttp.ClientSession, asyncio.Semaphore]":
+        """HTTP session authenticated as the logged in user, plus a request limit."""
+        import aiohttp
+
+        session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {self.client.token}"}
+        )
+        return session, asyncio.Semaphore(self.workers)
+
+    async def _fetch_note(
+        self,
+        session: "aiohttp.ClientSession",
+        sem: asyncio.Semaphore,
+        url: str,
+        skip_reviews: bool,
+    ) -> dict[str, Any]:
+        """Fetch the note behind a forum URL, with its replies unless skipped."""
+        params = {"id": parse_qs(urlparse(url).query)["id"][0]}
+        if not skip_reviews:
+            params["details"] = "replies"
+        async with sem, session.get(f"{API_BASEURL}/notes", params=params) as r:
+            r.raise_for_status()
+            data = await r.json()
+        note: dict[str, Any] = data["notes"][0]
+        return note
+
+    def load_submission(self, url: str, skip_reviews: bool = False) -> Submission:
+        """Fetch a submission note (and its replies) and parse info.
+
+        Args:
+        url (str): URL to submission.
+        skip_reviews (bool): Skip looking for reviews and ratings?
+
+        Returns:
+        Instance of Submission().
+        """
+        return next(self.load_all_submissions(skip_reviews, [url]))
+
+    def load_all_submissions(
+        self, skip_reviews: bool = False, paper_urls: Optional[list[str]] = None
+    ) -> Iterator[Submission]:
+        """Yield submission info as it loads, in the order of paper_urls.
+
+        All notes are requested concurrently on one event loop, at most
+        `workers` at a time, and yielded in order as they arrive.
+
+        Args:
+        skip_reviews (bool): Skip looking for reviews and ratings?
+        paper_urls (list[str]): Submissions to load, all of them if None.
+        """
+        from tqdm import tqdm
+
+        if paper_urls is None:
+            paper_urls = self.paper_urls
+
+        loop = asyncio.new_event_loop()
+        session, sem = loop.run_until_complete(self._open_session())
+        tasks = [
+            loop.create_task(self._fetch_note(session, sem, url, skip_reviews))
+            for url in paper_urls
+        ]
+        try:
+            for task in tqdm(tasks):
+                note = loop.run_until_complete(task)
+                yield self._parse_note(note, skip_reviews)
+        finally:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(session.close())
+            loop.close()
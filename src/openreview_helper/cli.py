@@ -0,0 +1,389 @@
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import secrets
+import string
+import sys
+from dataclasses import fields
+from typing import IO, TYPE_CHECKING
+
+from .config import CONFIG_FILE, ConfigLoader
+from .models import Submission
+from .utils import int_list_to_str, stats
+
+if TYPE_CHECKING:
+    from .api import ORAPI, ORClient
+
+CSV_HEADER = [
+    "#",
+    "ID",
+    "Title",
+    "Ratings",
+    "Avg",
+    "Std",
+    "Confidences",
+    "Final Ratings",
+    "Final Avg",
+    "Final Std",
+]
+
+
+def setup_logger(debug: bool = False) -> None:
+    from rich.console import Console
+    from rich.logging import RichHandler
+    from rich.style import Style
+    from rich.theme import Theme
+
+    logging_level = logging.DEBUG if debug else logging.INFO
+
+    logging.basicConfig(
+        level=logging_level,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[
+            RichHandler(
+                rich_tracebacks=True,
+                show_time=True,
+                show_level=True,
+                show_path=False,
+                markup=True,
+                console=Console(
+                    stderr=True,
+                    theme=Theme(
+                        {
+                            "logging.level.debug": Style(color="blue"),
+                            "logging.level.info": Style(color="green"),
+                            "logging.level.warning": Style(color="yellow", bold=True),
+                            "logging.level.error": Style(color="red"),
+                            "logging.level.critical": Style(
+                                color="white", bgcolor="red", bold=True
+                            ),
+                        }
+                    ),
+                ),
+            )
+        ],
+    )
+
+
+def load_and_save(
+    obj: "ORAPI | ORClient", skip_reviews: bool, filename: str, resume: bool
+) -> list[Submission]:
+    """Load all submissions, saving each one to a JSONL file as soon as it loads.
+
+    Args:
+    obj (ORAPI | ORClient): Logged in scraper to load submissions with.
+    skip_reviews (bool): Skip looking for reviews and ratings?
+    filename (str): JSONL file to save submissions to.
+    resume (bool): Keep submissions already in the file and skip loading them.
+
+    Returns:
+    List of Submission() in the order of the dashboard.
+    """
+    done = load_jsonl(filename) if resume else {}
+    pending = [url for url in obj.paper_urls if url not in done]
+    if done:
+        logging.info(f"Resuming, {len(obj.paper_urls) - len(pending)} already saved.")
+
+    with open(filename, "a" if resume else "w", encoding="utf-8") as f:
+        for url, sub in zip(pending, obj.load_all_submissions(skip_reviews, pending)):
+            save_jsonl_record(f, url, sub)
+            done[url] = sub
+
+    return [done[url] for url in obj.paper_urls if url in done]
+
+
+def write_csv(f: IO[str], subs: list[Submission]) -> None:
+    """Write submissions as CSV with all fields matching the rich table."""
+    # Format everything in memory first, then hand it to f in one write.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    writer.writerows(
+        (
+            idx + 1,
+            sub.sub_id,
+            sub.title,
+            int_list_to_str(sub.ratings),
+            *stats(sub.ratings),
+            int_list_to_str(sub.confidences),
+            int_list_to_str(sub.final_ratings),
+            *stats(sub.final_ratings),
+        )
+        for idx, sub in enumerate(subs)
+    )
+    f.write(buffer.getvalue())
+
+
+def print_csv(subs: list[Submission]) -> None:
+    """Print as CSV with all fields matching the rich table."""
+    write_csv(sys.stdout, subs)
+
+
+def save_jsonl_record(f: IO[str], url: str, sub: Submission) -> None:
+    """Append one submission to an open JSONL file and flush it to disk."""
+    record = {fld.name: getattr(sub, fld.name) for fld in fields(sub) if fld.init}
+    # One write per record, so an interrupted run can at worst leave a
+    # partial last line behind, which load_jsonl() drops.
+    f.write(json.dumps({"url": url, **record}) + "\n")
+    f.flush()
+
+
+def load_jsonl(filename: str) -> dict[str, Submission]:
+    """Load submissions saved by save_jsonl_record, keyed by their URL.
+
+    A run killed mid-write can leave a partial last line behind. It is dropped
+    with a warning and cut from the file, so appended records start on a line
+    of their own.
+    """
+    if not os.path.exists(filename):
+        return {}
+
+    subs = {}
+    with open(filename, "r+b") as f:
+        lines = f.readlines()
+        good_end = 0
+        for idx, line in enumerate(lines):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    if idx < len(lines) - 1:
+                        raise
+                    logging.warning(
+                        f"Dropping partially written last line of {filename}"
+                    )
+                    break
+                url = record.pop("url")
+                subs[url] = Submission(**record)
+            good_end += len(line)
+
+        f.truncate(good_end)
+        if good_end:
+            f.seek(good_end - 1)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    return subs
+
+
+def save_csv(subs: list[Submission], filename: str = "submissions.csv") -> None:
+    """Save submissions as CSV file with all fields matching the rich table."""
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        write_csv(f, subs)
+
+    print(f"CSV saved to {filename}")
+
+
+def print_rich(subs: list[Submission]) -> None:
+    """Pretty print table, or plain tab-separated rows when not on a terminal."""
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+
+    rows = [
+        (
+            f"{idx + 1}",
+            sub.sub_id,
+            sub.title,
+            int_list_to_str(sub.ratings),
+            *stats(sub.ratings),
+            int_list_to_str(sub.confidences),
+            int_list_to_str(sub.final_ratings),
+            *stats(sub.final_ratings),
+        )
+        for idx, sub in enumerate(subs)
+    ]
+
+    if not console.is_terminal:
+        # Piped output has no use for the layout and styling, skip rendering.
+        console.file.write(
+            "".join("\t".join(row) + "\n" for row in [tuple(CSV_HEADER), *rows])
+        )
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("#", justify="right")
+    table.add_column("ID", justify="right")
+    table.add_column("Title", justify="left")
+    table.add_column("Ratings", justify="right")
+    table.add_column("Avg.", justify="right")
+    table.add_column("Std.", justify="right")
+    table.add_column("Confidences", justify="right")
+    table.add_column("Final Ratings", justify="right")
+    table.add_column("Avg.", justify="right")
+    table.add_column("Std.", justify="right")
+
+    for row in rows:
+        table.add_row(*row)
+
+    console.print(table)
+
+
+def parse_args() -> argparse.Namespace:
+    # Load available conferences from config
+    try:
+        config_loader = ConfigLoader()
+        available_confs = config_loader.list_conferences()
+    except FileNotFoundError:
+        print(f"Warning: {CONFIG_FILE} not found. Using default conferences.")
+        available_confs = ["iclr_2025", "cvpr_2025"]
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--headless", action="store_true", help="Run in headless mode?")
+    parser.add_argument(
+        "--skip_reviews",
+        action="store_true",
+        help="Skip reviews? Select if no reviews are in yet.",
+    )
+    parser.add_argument(
+        "--conf",
+        type=str,
+        default=available_confs[0] if available_confs else "iclr_2025",
+        choices=available_confs,
+        help=f"Conference to scrape. Available: {', '.join(available_confs)}",
+    )
+    parser.add_argument("--simulate", action="store_true", help="Simulate the process.")
+    parser.add_argument(
+        "--api",
+        action="store_true",
+        help="Fetch submissions through the OpenReview API instead of a browser.",
+    )
+    parser.add_argument(
+        "--config", type=str, default=CONFIG_FILE, help="Path to configuration file"
+    )
+    parser.add_argument(
+        "--list-conferences",
+        action="store_true",
+        help="List all available conferences and exit",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    parser.add_argument(
+        "--save_pages",
+        action="store_true",
+        help="Save HTML pages of submissions for debugging purposes",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of submissions to load in parallel (default: 4 browsers, 50 API requests)",
+    )
+    parser.add_argument(
+        "--grid_url",
+        type=str,
+        default=None,
+        help="Selenium Grid hub URL, e.g. http://localhost:4444/wd/hub",
+    )
+    parser.add_argument(
+        "--browser",
+        type=str,
+        default="firefox",
+        choices=["firefox", "chromium"],
+        help="Browser to scrape with",
+    )
+    parser.add_argument(
+        "--marionette_port",
+        type=int,
+        default=None,
+        help="Attach to a Firefox started with --marionette on this port",
+    )
+    parser.add_argument(
+        "--no_cookie_cache",
+        action="store_true",
+        help="Do not reuse or save the browser login in ./.or_cookies.json",
+    )
+    parser.add_argument(
+        "--csv",
+        type=str,
+        default="submissions.csv",
+        help="Path to save the CSV file",
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=str,
+        default="submissions.jsonl",
+        help="Path to the JSONL file each submission is saved to as it loads "
+        "(overwritten unless --resume is given)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip submissions already saved in the JSONL file",
+    )
+
+    args = parser.parse_args()
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+
+    # List conferences if requested
+    if args.list_conferences:
+        try:
+            config_loader = ConfigLoader(args.config)
+            conferences = config_loader.list_conferences()
+            print("Available conferences:")
+            for conf in conferences:
+                conf_config = config_loader.get_config(conf)
+                print(f"  - {conf}: {conf_config.url}")
+        except FileNotFoundError:
+            print(f"Configuration file {args.config} not found!")
+        return
+
+    if args.simulate:
+        subs = []
+        for _ in range(5):
+            ratings = [secrets.choice(range(1, 6)) for _ in range(secrets.randbelow(4))]
+            final_ratings = [
+                secrets.choice(range(1, 6)) for _ in range(secrets.randbelow(4))
+            ]
+            subs.append(
+                Submission(
+                    title="Title " + secrets.choice(string.ascii_uppercase),
+                    sub_id=str(secrets.randbelow(19000) + 1000),
+                    ratings=ratings,
+                    confidences=[
+                        secrets.choice(range(1, 5 + 1)) for _ in range(len(ratings))
+                    ],
+                    final_ratings=final_ratings,
+                )
+            )
+
+    else:
+        # Like rich for the logger, Selenium and the API client are slow to
+        # import and only needed here.
+        setup_logger(debug=args.debug)
+        from .api import COOKIE_FILE, ORAPI, ORClient
+
+        if args.api:
+            client = ORClient(
+                conf=args.conf, config_file=args.config, workers=args.workers or 50
+            )
+            subs = load_and_save(client, args.skip_reviews, args.jsonl, args.resume)
+        else:
+            with ORAPI(
+                conf=args.conf,
+                headless=args.headless,
+                config_file=args.config,
+                save_pages=args.save_pages,
+                workers=args.workers or 4,
+                grid_url=args.grid_url,
+                marionette_port=args.marionette_port,
+                browser=args.browser,
+                cookie_file=None if args.no_cookie_cache else COOKIE_FILE,
+            ) as scraper:
+                subs = load_and_save(
+                    scraper, args.skip_reviews, args.jsonl, args.resume
+                )
+
+        print_rich(subs)
+        save_csv(subs, filename=args.csv)
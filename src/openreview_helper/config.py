@@ -0,0 +1,156 @@
+import functools
+import json
+import logging
+import os
+from typing import Any, Optional
+
+import yaml  # type: ignore
+
+from .models import BrowserConfig, ConferenceConfig, FieldPattern
+
+CONFIG_FILE = "./conf.yaml"
+
+# libyaml's C parser when PyYAML was built with it, same semantics as safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _cache_file(config_file: str) -> str:
+    """JSON copy of the parsed YAML, which is much faster to load."""
+    return f"{config_file}.cache.json"
+
+
+def _read_cache(config_file: str) -> Optional[dict[str, Any]]:
+    """Parsed config from the cache, if it is newer than the YAML file."""
+    cache_file = _cache_file(config_file)
+    try:
+        if os.stat(cache_file).st_mtime_ns <= os.stat(config_file).st_mtime_ns:
+            return None
+        with open(cache_file, encoding="utf-8") as f:
+            data: dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data
+
+
+def _write_cache(config_file: str, data: dict[str, Any]) -> None:
+    """Atomically replace the cache with freshly parsed YAML data."""
+    cache_file = _cache_file(config_file)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Not cacheable (read-only directory, non-JSON values), parse again
+        # next time.
+        logging.debug(f"Could not cache configuration to {cache_file}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    path: str, mtime: float
+) -> tuple[dict[str, ConferenceConfig], Optional[BrowserConfig]]:
+    """Parse the configuration file once per (path, mtime).
+
+    ``mtime`` is only part of the cache key, so an edited file is reparsed.
+    """
+    data = _read_cache(path)
+    if data is None:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)  # noqa: S506 (safe loader)
+        _write_cache(path, data)
+
+    configs = {}
+    for conf_name, conf_data in data["conferences"].items():
+        configs[conf_name] = ConferenceConfig(
+            url=conf_data["url"],
+            rating_config=conf_data.get("rating", {}),
+            confidence_config=conf_data.get("confidence", {}),
+            final_rating_config=conf_data.get("final_rating", {}),
+        )
+
+    browser: Optional[BrowserConfig] = None
+    browser_config = data.get("browser")
+    if browser_config:
+        window_size = browser_config.get("window_size")
+        additional_args = browser_config.get("additional_args")
+        browser = BrowserConfig(
+            firefox_binary=browser_config.get("firefox_binary"),
+            geckodriver_path=browser_config.get("geckodriver_path"),
+            window_size=tuple(window_size) if window_size else None,
+            additional_args=tuple(additional_args) if additional_args else None,
+        )
+
+    return configs, browser
+
+
+class ConfigLoader:
+    """Loads and manages conference configurations."""
+
+    def __init__(self, config_file: str = CONFIG_FILE):
+        self.config_file = config_file
+        self.browser_config: Optional[BrowserConfig] = None
+        self.configs = self._load_configs()
+
+    def _load_configs(self) -> dict[str, ConferenceConfig]:
+        """Load configurations from YAML file, reusing an earlier parse."""
+        if not os.path.exists(self.config_file):
+            raise FileNotFoundError(f"Configuration file {self.config_file} not found!")
+
+        configs, self.browser_config = _load_config_cached(
+            os.path.abspath(self.config_file), os.path.getmtime(self.config_file)
+        )
+        return configs
+
+    def get_config(self, conf_name: str) -> ConferenceConfig:
+        """Get configuration for a specific conference."""
+        if conf_name not in self.configs:
+            raise ValueError(
+                f"Conference '{conf_name}' not found in configuration. Available: {list(self.configs.keys())}"
+            )
+        return self.configs[conf_name]
+
+    def list_conferences(self) -> list[str]:
+        """List all available conferences."""
+        return list(self.configs.keys())
+
+
+class TextExtractor:
+    """Utility class for extracting values from text based on configuration."""
+
+    @staticmethod
+    def extract_value(text: str, field: FieldPattern) -> Optional[int]:
+        """First number after the first start_text in text, before end_text."""
+        start_text, pattern = field
+        start_idx = text.find(start_text)
+        if start_idx == -1:
+            return None
+        match = pattern.match(text, start_idx + len(start_text))
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def extract_reviews(
+        texts: list[str], conf_config: ConferenceConfig
+    ) -> tuple[list[int], list[int], list[int]]:
+        """Extract ratings, confidences and final ratings from review texts."""
+        ratings: list[int] = []
+        final_ratings: list[int] = []
+        confidences: list[int] = []
+
+        targets = [
+            (field, target_list)
+            for field, target_list in zip(
+                conf_config.field_patterns, (ratings, confidences, final_ratings)
+            )
+            if field is not None
+        ]
+        for content in texts:
+            # Values may be missing or in any order within a review.
+            for field, target_list in targets:
+                value = TextExtractor.extract_value(content, field)
+                if value is not None:
+                    target_list.append(value)
+
+        return ratings, confidences, final_ratings
@@ -0,0 +1,94 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .utils import int_list_to_str, mean_var
+
+# start_text, and a regex matched right after its first occurrence that
+# captures the first number there.
+FieldPattern = tuple[str, re.Pattern[str]]
+
+
+def _field_pattern(config: dict[str, Any]) -> Optional[FieldPattern]:
+    """FieldPattern to extract a field with, None to skip the field.
+
+    The number has to come before end_text, if set. The lookahead stops the
+    scan there, so no separate search for end_text is needed.
+    """
+    if not config or not config.get("start_text"):
+        return None
+    if config.get("extract_method", "first_number") != "first_number":
+        return None
+    end_text = config.get("end_text")
+    if end_text:
+        not_end = rf"(?!{re.escape(end_text)})"
+        pattern = rf"(?:{not_end}\D)*((?:{not_end}\d)+)"
+    else:
+        pattern = r"\D*(\d+)"
+    return config["start_text"], re.compile(pattern)
+
+
+@dataclass
+class ConferenceConfig:
+    """Configuration for a specific conference."""
+
+    url: str
+    rating_config: dict[str, Any]
+    confidence_config: dict[str, Any]
+    final_rating_config: dict[str, Any]
+    # _field_pattern() of the rating, confidence and final rating configs,
+    # compiled once instead of for every review.
+    field_patterns: tuple[Optional[FieldPattern], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.field_patterns = (
+            _field_pattern(self.rating_config),
+            _field_pattern(self.confidence_config),
+            _field_pattern(self.final_rating_config),
+        )
+
+
+@dataclass(frozen=True)
+class BrowserConfig:
+    """Configuration for the browser used by Selenium.
+
+    Frozen so it can key the drivers ORAPI keeps alive between instances.
+    """
+
+    firefox_binary: Optional[str] = None
+    geckodriver_path: Optional[str] = None
+    window_size: Optional[tuple[int, int]] = None
+    additional_args: Optional[tuple[str, ...]] = None
+
+
+@dataclass(slots=True)
+class Submission:
+    """Class containing submission details."""
+
+    title: str  # Title.
+    sub_id: str  # Paper ID.
+    ratings: list[int]  # List of reviewer ratings.
+    confidences: list[int]  # List of reviewer confidences.
+    final_ratings: list[int]  # List of final reviewer ratings.
+    _repr_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # Built on first __repr__, submissions are not modified after loading.
+
+    def __repr__(self) -> str:
+        if self._repr_cache is None:
+            self._repr_cache = f"Submission({self.sub_id}, {self.title}, {self.ratings}, {self.confidences})"
+        return self._repr_cache
+
+    def __str__(self) -> str:
+        return f"{self.sub_id}, {self.title}, *, {int_list_to_str(self.ratings)}, *, {int_list_to_str(self.final_ratings)}"
+
+    def info(self) -> str:
+        avg, var = mean_var(self.ratings)
+        return (
+            f"ID: {self.sub_id}, {self.title}, "
+            + f"Ratings: {self.ratings}, "
+            + f"Avg: {avg:.2f}, "
+            + f"Var: {var:.2f}"
+        )
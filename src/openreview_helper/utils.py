@@ -0,0 +1,27 @@
+import math
+from collections.abc import Sequence
+
+
+def int_list_to_str(ints: list[int]) -> str:
+    return ", ".join(map(str, ints)) or "-"
+
+
+def mean_var(values: Sequence[float]) -> tuple[float, float]:
+    """Mean and population variance, two passes in plain Python.
+
+    Reviewer scores are a handful of numbers, too few for NumPy's per-call
+    overhead to pay off. Both are NaN for an empty sequence.
+    """
+    n = len(values)
+    if not n:
+        return math.nan, math.nan
+    mean_val = sum(values) / n
+    return mean_val, sum((x - mean_val) * (x - mean_val) for x in values) / n
+
+
+def stats(values: Sequence[float], prec: int = 2) -> tuple[str, str]:
+    """Mean and standard deviation of values, formatted, "-" if there are none."""
+    if not values:
+        return "-", "-"
+    mean_val, var_val = mean_var(values)
+    return f"{mean_val:.{prec}f}", f"{math.sqrt(var_val):.{prec}f}"
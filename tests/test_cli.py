@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+from openreview_helper.cli import load_jsonl, save_jsonl_record
+from openreview_helper.models import Submission
+
+
+def _save(path: Path, subs: dict[str, Submission]) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        for url, sub in subs.items():
+            save_jsonl_record(f, url, sub)
+
+
+def test_load_jsonl_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "subs.jsonl"
+    subs = {
+        "u1": Submission("A", "1", [6, 8], [4, 3], []),
+        "u2": Submission("B", "2", [], [], [5]),
+    }
+    _save(path, subs)
+    assert load_jsonl(str(path)) == subs
+
+
+def test_load_jsonl_drops_truncated_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "subs.jsonl"
+    first = Submission("A", "1", [6], [4], [])
+    _save(path, {"u1": first})
+    line = json.dumps({"url": "u2", "title": "B", "sub_id": "2"})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line[: len(line) // 2])
+
+    assert load_jsonl(str(path)) == {"u1": first}
+    # The partial line is cut off, so the next record starts on its own line.
+    second = Submission("B", "2", [7], [2], [])
+    _save(path, {"u2": second})
+    assert load_jsonl(str(path)) == {"u1": first, "u2": second}
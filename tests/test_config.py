@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+
+from openreview_helper.config import (
+    ConfigLoader,
+    TextExtractor,
+    _cache_file,
+    _read_cache,
+    _write_cache,
+)
+from openreview_helper.models import ConferenceConfig, _field_pattern
+
+RATING = {"start_text": "Rating: ", "end_text": "Confidence: "}
+
+
+def test_extract_value_reads_first_number_in_window() -> None:
+    field = _field_pattern(RATING)
+    assert field is not None
+    assert TextExtractor.extract_value("Rating: 6: accept\nConfidence: 4", field) == 6
+
+
+def test_extract_value_stops_at_end_text() -> None:
+    field = _field_pattern(RATING)
+    assert field is not None
+    assert TextExtractor.extract_value("Rating: none\nConfidence: 4", field) is None
+
+
+def test_extract_value_only_looks_after_first_start_text() -> None:
+    # A later "Rating: " does not count once the first window had no number.
+    field = _field_pattern(RATING)
+    assert field is not None
+    assert TextExtractor.extract_value("Rating: Confidence: Rating: 11", field) is None
+
+
+def test_extract_reviews_skips_missing_fields() -> None:
+    conf = ConferenceConfig(
+        url="",
+        rating_config=RATING,
+        confidence_config={"start_text": "Confidence: "},
+        final_rating_config={"start_text": None},
+    )
+    texts = ["Rating: 6\nConfidence: 4", "Confidence: 3", "Comment: Rating: 8 is fair"]
+    assert TextExtractor.extract_reviews(texts, conf) == ([6, 8], [4, 3], [])
+
+
+CONFIG_YAML = """
+conferences:
+  conf_a:
+    url: 'https://openreview.net/group?id=A'
+"""
+
+
+def _write_config(tmp_path: Path, text: str = CONFIG_YAML) -> str:
+    config_file = tmp_path / "conf.yaml"
+    config_file.write_text(text)
+    return str(config_file)
+
+
+def _set_mtime(path: str, seconds: int) -> None:
+    os.utime(path, (seconds, seconds))
+
+
+def test_cache_newer_than_yaml_is_used(tmp_path: Path) -> None:
+    config_file = _write_config(tmp_path)
+    cached = {"conferences": {"conf_b": {"url": "cached"}}}
+    Path(_cache_file(config_file)).write_text(json.dumps(cached))
+    _set_mtime(config_file, 1_000)
+    _set_mtime(_cache_file(config_file), 2_000)
+
+    assert _read_cache(config_file) == cached
+    assert ConfigLoader(config_file).list_conferences() == ["conf_b"]
+
+
+def test_edited_yaml_forces_reparse(tmp_path: Path) -> None:
+    config_file = _write_config(tmp_path)
+    stale = {"conferences": {"conf_b": {"url": "stale"}}}
+    Path(_cache_file(config_file)).write_text(json.dumps(stale))
+    _set_mtime(_cache_file(config_file), 1_000)
+    _set_mtime(config_file, 2_000)
+
+    assert _read_cache(config_file) is None
+    assert ConfigLoader(config_file).list_conferences() == ["conf_a"]
+    # The reparsed YAML replaced the stale cache.
+    cached = json.loads(Path(_cache_file(config_file)).read_text())
+    assert list(cached["conferences"]) == ["conf_a"]
+
+
+def test_unwritable_cache_falls_back_to_yaml(tmp_path: Path) -> None:
+    config_file = _write_config(tmp_path)
+    # A directory in the way makes replacing the cache fail like a
+    # read-only location would, even when running as root.
+    os.mkdir(_cache_file(config_file))
+
+    assert ConfigLoader(config_file).list_conferences() == ["conf_a"]
+    assert os.path.isdir(_cache_file(config_file))
+    assert sorted(os.listdir(tmp_path)) == ["conf.yaml", "conf.yaml.cache.json"]
+
+
+def test_non_json_values_are_not_cached(tmp_path: Path) -> None:
+    config_file = _write_config(tmp_path)
+    _write_cache(config_file, {"deadline": {1, 2}})
+
+    assert not os.path.exists(_cache_file(config_file))
+    assert os.listdir(tmp_path) == ["conf.yaml"]